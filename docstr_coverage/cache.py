@@ -0,0 +1,119 @@
+"""Module containing an on-disk cache of visited files, which allows repeated runs (e.g. in
+pre-commit hooks) to skip parsing and visiting files that did not change since the last run"""
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from importlib.metadata import PackageNotFoundError, version
+from typing import Optional, Tuple
+
+from docstr_coverage.visitor import ModuleNode, Node
+
+# Version of the format of the cached entries (i.e., of `DocStringCoverageVisitor.tree`).
+#   Has to be increased whenever the format changes, as it is part of the cache directory name.
+CACHE_FORMAT_VERSION = 3
+
+
+def default_cache_dir() -> str:
+    """The directory in which the cache is stored by default: `docstr_coverage` in the user's
+    cache directory (`$XDG_CACHE_HOME`, falling back to `~/.cache`)"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "docstr_coverage")
+
+
+def _cache_version() -> str:
+    """Identifies the versions the cached entries depend on: Those of docstr-coverage,
+    of the cache format, and of Python (whose `ast` module determines what is found in a file)"""
+    try:
+        package_version = version("docstr-coverage")
+    except PackageNotFoundError:
+        package_version = "unknown"
+    return "{}-{}-py{}.{}".format(package_version, CACHE_FORMAT_VERSION, *sys.version_info[:2])
+
+
+def _encode_node(node: Node) -> list:
+    """The JSON-serializable representation of the definition `node` and its nested definitions"""
+    return [node.name, node.has_doc, node.decorator, [_encode_node(c) for c in node.children]]
+
+
+def _decode_node(encoded_node: list) -> Node:
+    """The definition (and its nested definitions) represented by `encoded_node`"""
+    name, has_doc, decorator, encoded_children = encoded_node
+    node = Node(name=name, has_doc=has_doc, decorator=decorator)
+    node.children = [_decode_node(c) for c in encoded_children]
+    return node
+
+
+class FileCache:
+    """Stores the result of visiting a file (see `coverage._visit_file`) on disk, keyed by the
+    file's absolute path, modification time and size. Entries of other versions of
+    docstr-coverage or Python are stored in separate directories, thus never read.
+
+    Entries are stored as JSON (not pickled), such that reading a tampered cache directory can
+    never execute code. The cache is best-effort: Entries which cannot be read or written are
+    treated as missing."""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Parameters
+        ----------
+        cache_dir: String, or None
+            Root directory of the cache. If None, :func:`default_cache_dir` is used"""
+        self._directory = os.path.join(cache_dir or default_cache_dir(), _cache_version())
+
+    @staticmethod
+    def key(filename: str) -> Tuple[str, int, int]:
+        """The key of the (current state of the) file `filename`. To not associate an outdated
+        result with a changed file, the key should be taken before the file is read.
+
+        Parameters
+        ----------
+        filename: String
+            Absolute or relative path of the file
+
+        Returns
+        -------
+        Tuple
+            The absolute path, the modification time (in ns), and the size of the file"""
+        stat = os.stat(filename)
+        return os.path.abspath(filename), stat.st_mtime_ns, stat.st_size
+
+    def _entry_path(self, key: Tuple[str, int, int]) -> str:
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        # Shard the entries into subdirectories, to avoid huge directories
+        return os.path.join(self._directory, digest[:2], digest + ".json")
+
+    def get(self, key: Tuple[str, int, int]) -> Optional[ModuleNode]:
+        """The cached result for `key`, or None if there is none"""
+        try:
+            with open(self._entry_path(key), encoding="utf-8") as f:
+                cached_key, has_doc, is_empty, encoded_children = json.load(f)
+            # Guards against (very unlikely) hash collisions
+            if tuple(cached_key) != key:
+                return None
+            result = ModuleNode(has_doc=has_doc, is_empty=is_empty)
+            result.children = [_decode_node(c) for c in encoded_children]
+        except Exception:
+            # Missing, unreadable, corrupt or malformed entries can fail in many ways:
+            #   All of them are a cache miss
+            return None
+        return result
+
+    def put(self, key: Tuple[str, int, int], result: ModuleNode) -> None:
+        """Stores the `result` for `key` in the cache"""
+        encoded = [key, result.has_doc, result.is_empty, [_encode_node(c) for c in result.children]]
+        entry_path = self._entry_path(key)
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            # Write to a temporary file first, such that concurrent runs never read partial entries
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(entry_path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(encoded, f, separators=(",", ":"))
+                os.replace(temp_path, entry_path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except OSError:
+            pass
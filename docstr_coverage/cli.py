@@ -10,6 +10,7 @@ from typing import List, Optional
 import click
 
 from docstr_coverage.badge import Badge
+from docstr_coverage.cache import FileCache
 from docstr_coverage.config_file import set_config_defaults
 from docstr_coverage.coverage import analyze
 from docstr_coverage.ignore_config import IgnoreConfig
@@ -231,6 +232,20 @@ def parse_ignore_patterns_from_dict(ignore_patterns_dict) -> tuple:
     is_flag=True,
     help="Exit with code 0 if no Python files are found (default: exit code 1)",
 )
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=0),
+    default=1,
+    help="Number of processes used to parse the files (0: one per CPU)",
+    show_default=True,
+    metavar="NUMBER",
+)
+@click.option(
+    "--cache",
+    is_flag=True,
+    help="Cache parsed files (in ~/.cache/docstr_coverage) to skip unchanged files in later runs",
+)
 @click.help_option("-h", "--help")
 @click.argument(
     "paths",
@@ -344,7 +359,14 @@ def execute(paths, **kwargs):
 
     # Calculate docstring coverage
     show_progress = not kwargs["percentage_only"]
-    results = analyze(all_paths, ignore_config=ignore_config, show_progress=show_progress)
+    cache = FileCache() if kwargs["cache"] else None
+    results = analyze(
+        all_paths,
+        ignore_config=ignore_config,
+        show_progress=show_progress,
+        jobs=kwargs["jobs"] or None,
+        cache=cache,
+    )
 
     report_format: str = kwargs["format"]
     if report_format == "markdown":
@@ -362,21 +384,22 @@ def execute(paths, **kwargs):
     else:
         raise SystemError("Unknown output type: {0}".format(destination))
 
-    file_results, total_results = results.to_legacy()
+    # Only the total coverage is needed from here on: Avoid building the per-file legacy results
+    total_coverage = results.count_aggregate().coverage()
 
     # Save badge
     if kwargs["badge"]:
-        badge = Badge(kwargs["badge"], total_results["coverage"])
+        badge = Badge(kwargs["badge"], total_coverage)
         badge.save()
 
         if kwargs["verbose"]:
             print("Docstring coverage badge saved to {!r}".format(badge.path))
 
     if kwargs["percentage_only"] is True:
-        print(total_results["coverage"])
+        print(total_coverage)
 
     # Exit
-    if total_results["coverage"] < kwargs["fail_under"]:
+    if total_coverage < kwargs["fail_under"]:
         raise SystemExit(1)
 
     raise SystemExit(0)
@@ -3,14 +3,16 @@
 import os
 import re
 from ast import parse
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from tqdm import tqdm
 
+from docstr_coverage.cache import FileCache
 from docstr_coverage.ignore_config import IgnoreConfig
 from docstr_coverage.printers import LegacyPrinter
 from docstr_coverage.result_collection import File, FileStatus, ResultCollection
-from docstr_coverage.visitor import DocStringCoverageVisitor
+from docstr_coverage.visitor import DocStringCoverageVisitor, ModuleNode, Node
 
 
 def _do_ignore_node(filename: str, base_name: str, node_name: str, ignore_names: tuple) -> bool:
@@ -63,7 +65,7 @@ def _do_ignore_node(filename: str, base_name: str, node_name: str, ignore_names:
 
 def _analyze_docstrings_on_node(
     base: str,
-    node: Tuple[str, bool, Optional[str], List],
+    node: Node,
     filename,
     ignore_config: IgnoreConfig,
     result_storage: File,
@@ -75,11 +77,9 @@ def _analyze_docstrings_on_node(
     ----------
     base: String
         The name of this node's parent node
-    node: Tuple triple of (String, Boolean, List)
-        Information describing a node. `node[0]` is the node's name.
-        `node[1]` is True if the node was properly documented,
-        else False. `node[3]` is a list containing the node's children
-        as triples of the same form (if it had any)
+    node: Node
+        Information describing a node: Its name, whether it was properly documented,
+        its relevant decorator (if any), and its children (if it had any)
     filename: String
         String containing the name of the file.
     ignore_config: IgnoreConfig
@@ -88,7 +88,7 @@ def _analyze_docstrings_on_node(
         The result-collection.File instance on which the observed
         docstring presence should be stored."""
 
-    name, has_doc, decorator, child_nodes = node
+    name, has_doc, decorator = node.name, node.has_doc, node.decorator
 
     ##################################################
     # Check Current Node
@@ -129,7 +129,7 @@ def _analyze_docstrings_on_node(
     ##################################################
     # Check Child Nodes
     ##################################################
-    for _symbol in child_nodes:
+    for _symbol in node.children:
         _analyze_docstrings_on_node("%s." % name, _symbol, filename, ignore_config, result_storage)
 
 
@@ -217,8 +217,63 @@ def get_docstring_coverage(
     return results.to_legacy()
 
 
+def _visit_file(filename: str) -> ModuleNode:
+    """Read and parse the source of `filename`, and collect the docstring information of the module
+    and of all classes and functions within. Defined at module level, such that it can be run in
+    worker processes
+
+    Parameters
+    ----------
+    filename: String
+        Absolute or relative path of the file to visit
+
+    Returns
+    -------
+    ModuleNode
+        The root of :attr:`DocStringCoverageVisitor.tree`"""
+    with open(filename, "r", encoding="utf-8") as f:
+        source_tree = f.read()
+
+    # Pass the source on, such that the file is read only once
+    doc_visitor = DocStringCoverageVisitor(filename=filename, source=source_tree)
+    doc_visitor.visit(parse(source_tree))
+    return doc_visitor.tree[0]
+
+
+def _iter_visited_files(
+    filenames: list, jobs: Optional[int], cache: Optional[FileCache] = None
+) -> Iterator[ModuleNode]:
+    """Visit `filenames` (see :func:`_visit_file`), in order, either in this process or
+    distributed over a pool of `jobs` worker processes. If `jobs` is None, one worker process
+    per CPU is used. If a `cache` is passed, only the files which are not in the cache are visited
+    (and subsequently added to the cache)"""
+    if cache is not None:
+        keys = [cache.key(filename) for filename in filenames]
+        trees = [cache.get(key) for key in keys]
+        uncached = [filename for filename, tree in zip(filenames, trees) if tree is None]
+        visited = _iter_visited_files(uncached, jobs)
+        for key, tree in zip(keys, trees):
+            if tree is None:
+                tree = next(visited)
+                cache.put(key, tree)
+            yield tree
+        return
+    if jobs == 1:
+        yield from map(_visit_file, filenames)
+        return
+    workers = jobs or os.cpu_count() or 1
+    # Send the files to the workers in chunks, to amortize the inter-process communication
+    chunksize = max(1, len(filenames) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_visit_file, filenames, chunksize=chunksize)
+
+
 def analyze(
-    filenames: list, ignore_config: IgnoreConfig = IgnoreConfig(), show_progress=True
+    filenames: list,
+    ignore_config: IgnoreConfig = IgnoreConfig(),
+    show_progress=True,
+    jobs: Optional[int] = 1,
+    cache: Optional[FileCache] = None,
 ) -> ResultCollection:
     """EXPERIMENTAL: More expressive alternative to `get_docstring_coverage`.
 
@@ -239,13 +294,21 @@ def analyze(
         show_progress: Boolean, default=True
             If True, prints a progress bar to stdout
 
+        jobs: Int, or None, default=1
+            Number of processes among which the files are parsed and visited. If None, one
+            process per CPU is used. If 1, the files are processed in the current process
+
+        cache: FileCache, or None, default=None
+            If passed, files which did not change since they were last analyzed with this cache
+            are not parsed again
+
     Returns
     -------
     ResultCollection
         The collected information about docstring presence"""
     results = ResultCollection()
 
-    iterator = iter(filenames)
+    iterator = zip(filenames, _iter_visited_files(filenames, jobs, cache))
     if show_progress:
         iterator = tqdm(
             iterator,
@@ -255,38 +318,28 @@ def analyze(
             total=len(filenames),
         )
 
-    for filename in iterator:
+    for filename, _tree in iterator:
         file_result = results.get_file(file_path=filename)
 
-        ##################################################
-        # Read and Parse Source
-        ##################################################
-        with open(filename, "r", encoding="utf-8") as f:
-            source_tree = f.read()
-
-        doc_visitor = DocStringCoverageVisitor(filename=filename)
-        doc_visitor.visit(parse(source_tree))
-        _tree = doc_visitor.tree[0]
-
         ##################################################
         # Process Results
         ##################################################
 
-        # _tree contains [<module docstring>, <is_empty: bool>, <symbols: classes and funcs>]
-        if (not _tree[0]) and (not _tree[1]):
+        # _tree contains the module docstring, is_empty, and the symbols (classes and funcs)
+        if (not _tree.has_doc) and (not _tree.is_empty):
             if not ignore_config.skip_file_docstring:
                 file_result.collect_module_docstring(has_docstring=False)
             else:
                 file_result.collect_module_docstring(
                     has_docstring=False, ignore_reason="--skip-file-docstring=True"
                 )
-        elif _tree[1]:
+        elif _tree.is_empty:
             file_result.status = FileStatus.EMPTY
         else:
-            file_result.collect_module_docstring(bool(_tree[0]))
+            file_result.collect_module_docstring(bool(_tree.has_doc))
 
         # Recursively traverse through functions and classes
-        for symbol in _tree[-1]:
+        for symbol in _tree.children:
             _analyze_docstrings_on_node("", symbol, filename, ignore_config, file_result)
 
     return results
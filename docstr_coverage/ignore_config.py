@@ -1,6 +1,17 @@
 """Module containing a single utility data class: IgnoreConfig"""
 from typing import List, Tuple
 
+# Bit flags used in `IgnoreConfig.skip_mask`
+SKIP_MAGIC = 1 << 0
+SKIP_FILE_DOCSTRING = 1 << 1
+SKIP_INIT = 1 << 2
+SKIP_CLASS_DEF = 1 << 3
+SKIP_PRIVATE = 1 << 4
+SKIP_PROPERTY = 1 << 5
+ALL_SKIPS = (
+    SKIP_MAGIC | SKIP_FILE_DOCSTRING | SKIP_INIT | SKIP_CLASS_DEF | SKIP_PRIVATE | SKIP_PROPERTY
+)
+
 
 class IgnoreConfig:
     """Data class storing information about docstring types to ignore when aggregating coverage"""
@@ -26,6 +37,14 @@ class IgnoreConfig:
         self._skip_property = skip_property
         self._skip_setter = skip_setter
         self._skip_deleter = skip_deleter
+        self._skip_mask = (
+            (SKIP_MAGIC if skip_magic else 0)
+            | (SKIP_FILE_DOCSTRING if skip_file_docstring else 0)
+            | (SKIP_INIT if skip_init else 0)
+            | (SKIP_CLASS_DEF if skip_class_def else 0)
+            | (SKIP_PRIVATE if skip_private else 0)
+            | (SKIP_PROPERTY if skip_property else 0)
+        )
 
     @property
     def ignore_names(self):
@@ -36,6 +55,13 @@ class IgnoreConfig:
         of the remaining regexes"""
         return self._ignore_names
 
+    @property
+    def skip_mask(self):
+        """Integer bitmask of the enabled `skip_*` options (see the `SKIP_*` flags in this module),
+        allowing to check whether any of them is set with a single comparison against zero.
+        The `skip_setter` and `skip_deleter` options are not part of the mask"""
+        return self._skip_mask
+
     @property
     def skip_magic(self):
         """If True, skip all magic methods (methods with both leading and trailing double
@@ -2,11 +2,29 @@
 Currently, this module is in BETA and its interface may change in future versions."""
 import logging
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import List, Optional, Tuple, Union
+from bisect import bisect_right
+from typing import (
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-from docstr_coverage.ignore_config import IgnoreConfig
+from docstr_coverage.ignore_config import (
+    ALL_SKIPS,
+    SKIP_CLASS_DEF,
+    SKIP_FILE_DOCSTRING,
+    SKIP_INIT,
+    SKIP_MAGIC,
+    SKIP_PRIVATE,
+    IgnoreConfig,
+)
 from docstr_coverage.result_collection import (
+    MODULE_DOCSTRING_IDENTIFIER,
     AggregatedCount,
     File,
     FileStatus,
@@ -25,21 +43,57 @@ _GRADES = (
     ("Not documented at all", 2),
     ("Do you even docstring?", 0),
 )
+# The thresholds of `_GRADES` in ascending order (with their messages at the same indices), so that
+#   the grade of a coverage can be looked up with `bisect`
+_GRADE_THRESHOLDS = tuple(grade_threshold for _, grade_threshold in reversed(_GRADES))
+_GRADE_MESSAGES = tuple(message for message, _ in reversed(_GRADES))
+
+# (`IgnoreConfig.skip_mask` flag, legacy message, markdown message) of the reported skip options
+_SKIP_MESSAGES = (
+    (SKIP_MAGIC, " (skipped all non-init magic methods)", "- skipped all non-init magic methods\n"),
+    (SKIP_FILE_DOCSTRING, " (skipped file-level docstrings)", "- skipped file-level docstrings\n"),
+    (SKIP_INIT, " (skipped __init__ methods)", "- skipped __init__ methods\n"),
+    (SKIP_CLASS_DEF, " (skipped class definitions)", "- skipped class definitions\n"),
+    (SKIP_PRIVATE, " (skipped private methods)", "- skipped private methods\n"),
+)
+# The concatenated skip messages for every possible `IgnoreConfig.skip_mask`, indexed by the mask
+_LEGACY_SKIP_POSTFIXES = tuple(
+    "".join(message for flag, message, _ in _SKIP_MESSAGES if skip_mask & flag)
+    for skip_mask in range(ALL_SKIPS + 1)
+)
+_MARKDOWN_SKIP_POSTFIXES = tuple(
+    "".join(message for flag, _, message in _SKIP_MESSAGES if skip_mask & flag)
+    for skip_mask in range(ALL_SKIPS + 1)
+)
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO, format="%(message)s")
+# Importing this module must not configure logging: Until a printer is created,
+#   records are only handled by the importing application's logging configuration (if any)
+logger.addHandler(logging.NullHandler())
+
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+
+def _configure_logging():
+    """Sets up this module's logger to print the reports to stderr (once). The logging
+    configuration of the application, i.e. the root logger, is left alone: The reports are not
+    propagated to it. A level set on this module's logger beforehand is kept."""
+    if _stream_handler not in logger.handlers:
+        logger.addHandler(_stream_handler)
+        logger.propagate = False
+    if logger.level == logging.NOTSET:
+        logger.setLevel(logging.INFO)
 
 
-@dataclass(frozen=True)
-class IgnoredNode:
+class IgnoredNode(NamedTuple):
     """Data Structure for nodes that was ignored in checking."""
 
     identifier: str
     reason: str
 
 
-@dataclass(frozen=True)
-class FileCoverageStat:
+class FileCoverageStat(NamedTuple):
     """Data Structure of coverage info about one file.
 
     For `verbosity` with value:
@@ -47,6 +101,10 @@ class FileCoverageStat:
         * `3` - Fields with `verbosity` `2` and `nodes_without_docstring`.
         * `4` - Fields with `verbosity` `3` and `is_empty`, `nodes_with_docstring`,
           `ignored_nodes`
+
+    `nodes_with_docstring` and `nodes_without_docstring` are shared with the cache of
+    `File.partitioned_nodes` (to avoid copying them for every report): They are read-only,
+    modifying them would corrupt later reports of the same results.
     """
 
     coverage: float
@@ -54,14 +112,17 @@ class FileCoverageStat:
     missing: int
     needed: int
     path: str
-    ignored_nodes: Optional[Tuple[IgnoredNode, ...]]
+    ignored_nodes: Optional[Sequence[IgnoredNode]]
     is_empty: Optional[Union[bool]]
-    nodes_with_docstring: Optional[Tuple[str, ...]]
-    nodes_without_docstring: Optional[Tuple[str, ...]]
+    nodes_with_docstring: Optional[Sequence[str]]
+    nodes_without_docstring: Optional[Sequence[str]]
+
+    def __hash__(self):
+        # Hash only the lightweight summary fields, not the potentially long node tuples
+        return hash((self.path, self.needed, self.found, self.missing))
 
 
-@dataclass(frozen=True)
-class OverallCoverageStat:
+class OverallCoverageStat(NamedTuple):
     """Data Structure of coverage statistic."""
 
     found: int
@@ -86,7 +147,8 @@ class Printer(ABC):
     statistic data.
 
     In heir classes you can use `overall_coverage_stat` and `overall_files_coverage_stat`
-    attributes. Depends of given `verbosity` some data can be `None`."""
+    attributes. Depends of given `verbosity` some data can be `None`. To print the statistics of
+    files one at a time, without materializing all of them, use `iter_files_coverage_stat`."""
 
     def __init__(
         self,
@@ -104,11 +166,13 @@ class Printer(ABC):
         ignore_config: IgnoreConfig
             Config with ignoring setups.
         """
+        _configure_logging()
         self.verbosity: int = verbosity
         self.ignore_config: IgnoreConfig = ignore_config
         self.results: ResultCollection = results
         self.__overall_coverage_stat: Optional[Union[OverallCoverageStat, float]] = None
         self.__overall_files_coverage_stat: Optional[List[FileCoverageStat]] = None
+        self._generated_string: Optional[str] = None
 
     @property
     def overall_coverage_stat(self) -> Union[OverallCoverageStat, float]:
@@ -120,16 +184,13 @@ class Printer(ABC):
             * `2` - All fields."""
         if self.__overall_coverage_stat is None:
             count: AggregatedCount = self.results.count_aggregate()
+            total_coverage = count.coverage()
 
             if self.verbosity >= 1:
 
                 self.__overall_coverage_stat = OverallCoverageStat(
                     found=count.found,
-                    grade=next(
-                        message
-                        for message, grade_threshold in _GRADES
-                        if grade_threshold <= count.coverage()
-                    ),
+                    grade=_GRADE_MESSAGES[bisect_right(_GRADE_THRESHOLDS, total_coverage) - 1],
                     is_skip_class_def=self.ignore_config.skip_class_def,
                     is_skip_file_docstring=self.ignore_config.skip_file_docstring,
                     is_skip_init=self.ignore_config.skip_init,
@@ -139,11 +200,11 @@ class Printer(ABC):
                     needed=count.needed,
                     num_empty_files=count.num_empty_files,
                     num_files=count.num_files,
-                    total_coverage=count.coverage(),
+                    total_coverage=total_coverage,
                 )
 
             else:
-                self.__overall_coverage_stat = count.coverage()
+                self.__overall_coverage_stat = total_coverage
 
         return self.__overall_coverage_stat
 
@@ -162,64 +223,104 @@ class Printer(ABC):
         List[FileCoverageStat]
             Coverage info about all checked files."""
         if self.__overall_files_coverage_stat is None and self.verbosity >= 2:
-            overall_files_coverage_stat: List[FileCoverageStat] = []
-            for file_path, file_info in self.results.files():
-
-                file_path: str
-                file_info: File
-                nodes_without_docstring: Optional[Tuple[str, ...]]
-                is_empty: Optional[bool]
-                nodes_with_docstring: Optional[Tuple[str, ...]]
-                ignored_nodes: Optional[Tuple[IgnoredNode, ...]]
-
-                if self.verbosity >= 3:
-                    nodes_without_docstring = tuple(
-                        expected_docstring.node_identifier
-                        for expected_docstring in file_info._expected_docstrings
-                        if not expected_docstring.has_docstring
-                        and not expected_docstring.ignore_reason
-                    )
-                else:
-                    nodes_without_docstring = None
-
-                if self.verbosity >= 4:
-                    is_empty = file_info.status == FileStatus.EMPTY
-                    nodes_with_docstring = tuple(
-                        expected_docstring.node_identifier
-                        for expected_docstring in file_info._expected_docstrings
-                        if expected_docstring.has_docstring and not expected_docstring.ignore_reason
-                    )
-                    ignored_nodes = tuple(
-                        IgnoredNode(
-                            identifier=expected_docstring.node_identifier,
-                            reason=expected_docstring.ignore_reason,
-                        )
-                        for expected_docstring in file_info._expected_docstrings
-                        if expected_docstring.ignore_reason is not None
-                    )
-                else:
-                    is_empty = None
-                    nodes_with_docstring = None
-                    ignored_nodes = None
-
-                count = file_info.count_aggregate()
-                overall_files_coverage_stat.append(
-                    FileCoverageStat(
-                        coverage=count.coverage(),
-                        found=count.found,
-                        missing=count.missing,
-                        needed=count.needed,
-                        path=file_path,
-                        ignored_nodes=ignored_nodes,
-                        is_empty=is_empty,
-                        nodes_with_docstring=nodes_with_docstring,
-                        nodes_without_docstring=nodes_without_docstring,
-                    )
-                )
-            self.__overall_files_coverage_stat = overall_files_coverage_stat
+            self.__overall_files_coverage_stat = list(self.iter_files_coverage_stat())
 
         return self.__overall_files_coverage_stat
 
+    def iter_files_coverage_stat(self) -> Iterator[FileCoverageStat]:
+        """Lazily generate the coverage statistics for files, one file at a time.
+
+        The yielded statistics are the same as the ones in `overall_files_coverage_stat`, but
+        (unless they were already materialized through that property) they are built on demand and
+        not retained, so that the statistics of all files never have to be held in memory at once.
+        Yields nothing for `verbosity` below `2`.
+
+        Yields
+        ------
+        FileCoverageStat
+            Coverage info about one checked file."""
+        if self.verbosity < 2:
+            return
+        if self.__overall_files_coverage_stat is not None:
+            yield from self.__overall_files_coverage_stat
+            return
+
+        # Choose the collection path once, rather than checking the verbosity for every file
+        if self.verbosity >= 4:
+            collect_file_coverage_stat = self._collect_full_file_coverage_stat
+        elif self.verbosity == 3:
+            collect_file_coverage_stat = self._collect_missing_file_coverage_stat
+        else:
+            collect_file_coverage_stat = self._collect_summary_file_coverage_stat
+        for file_path, file_info in self.results.files():
+            yield collect_file_coverage_stat(file_path, file_info)
+
+    @staticmethod
+    def _collect_summary_file_coverage_stat(file_path: str, file_info: File) -> FileCoverageStat:
+        """Collect the coverage counts of a single file, without any node information (as
+        required for `verbosity` `2`)."""
+        count = file_info.count_aggregate()
+        return FileCoverageStat(
+            coverage=count.coverage(),
+            found=count.found,
+            missing=count.missing,
+            needed=count.needed,
+            path=file_path,
+            ignored_nodes=None,
+            is_empty=None,
+            nodes_with_docstring=None,
+            nodes_without_docstring=None,
+        )
+
+    @staticmethod
+    def _collect_missing_file_coverage_stat(file_path: str, file_info: File) -> FileCoverageStat:
+        """Collect the coverage counts of a single file, together with the nodes missing a
+        docstring (as required for `verbosity` `3`)."""
+        count = file_info.count_aggregate()
+        if count.missing:
+            _with_docstring, without_docstring, _ignored = file_info.partitioned_nodes
+        else:
+            # Nothing to partition: Fully documented files have no nodes without docstring
+            without_docstring = []
+        return FileCoverageStat(
+            coverage=count.coverage(),
+            found=count.found,
+            missing=count.missing,
+            needed=count.needed,
+            path=file_path,
+            ignored_nodes=None,
+            is_empty=None,
+            nodes_with_docstring=None,
+            nodes_without_docstring=without_docstring,
+        )
+
+    @staticmethod
+    def _collect_full_file_coverage_stat(file_path: str, file_info: File) -> FileCoverageStat:
+        """Collect the coverage counts of a single file, together with all node information (as
+        required for `verbosity` `4`)."""
+        with_docstring, without_docstring, ignored = file_info.partitioned_nodes
+        is_empty = file_info.status is FileStatus.EMPTY
+        # The counts follow from the partition, so there is no need for a second walk over the
+        #   expected docstrings in `file_info.count_aggregate()` (which counts nothing if empty)
+        if is_empty:
+            found, missing = 0, 0
+        else:
+            found, missing = len(with_docstring), len(without_docstring)
+        needed = found + missing
+        return FileCoverageStat(
+            coverage=found * 100 / needed if needed else 100.0,
+            found=found,
+            missing=missing,
+            needed=needed,
+            path=file_path,
+            ignored_nodes=[
+                IgnoredNode(identifier=identifier, reason=reason) for identifier, reason in ignored
+            ],
+            is_empty=is_empty,
+            nodes_with_docstring=with_docstring,
+            nodes_without_docstring=without_docstring,
+        )
+
     @abstractmethod
     def print_to_stdout(self) -> None:
         """Providing how to print coverage results."""
@@ -241,112 +342,124 @@ class LegacyPrinter(Printer):
     """Printer for legacy format."""
 
     def print_to_stdout(self) -> None:
-        for line in self._generate_string().split("\n"):
-            logger.info(line)
+        # Do not even generate the report if it would be dropped by the logger anyways
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        # Log the whole report as a single record: This results in one write to the output stream,
+        #   instead of one write (and flush) per line
+        logger.info(self._generate_string())
 
     def save_to_file(self, path: Optional[str] = None) -> None:
         if path is None:
             path = "./coverage-results.txt"
+        self._write_to_file(path)
+
+    def _write_to_file(self, path: str) -> None:
+        """Write the report to the file at `path`. Unless the report was already generated
+        (e.g. to print it), its fragments are streamed to the file as they are generated, without
+        ever materializing the whole report in memory."""
         with open(path, "w") as wf:
-            wf.write(self._generate_string())
+            if self._generated_string is not None or self._overrides("_generate_string"):
+                wf.write(self._generate_string())
+            else:
+                wf.writelines(self._iter_string_fragments())
 
     def _generate_string(self) -> str:
-        final_string: str = ""
-
-        if self.overall_files_coverage_stat is not None:
-            final_string += self._generate_file_stat_string()
-            final_string += "\n"
-        final_string += self._generate_overall_stat_string()
-
-        return final_string
-
-    def _generate_file_stat_string(self):
-        final_string: str = ""
-        for file_coverage_stat in self.overall_files_coverage_stat:
-
-            file_string: str = 'File: "{0}"\n'.format(file_coverage_stat.path)
-
-            if file_coverage_stat.is_empty is not None and file_coverage_stat.is_empty is True:
-                file_string += " - File is empty\n"
-
-            if file_coverage_stat.nodes_with_docstring is not None:
-                for node_identifier in file_coverage_stat.nodes_with_docstring:
-                    file_string += " - Found docstring for `{0}`\n".format(
-                        node_identifier,
-                    )
+        # The report is memoized, as it is needed twice if it is both printed and saved to file
+        if self._generated_string is None:
+            self._generated_string = "".join(self._iter_string_fragments())
+        return self._generated_string
+
+    def _iter_string_fragments(self) -> Iterator[str]:
+        """Generate the report as a sequence of string fragments, which joined form the report."""
+        if self.verbosity >= 2:
+            if self._overrides("_generate_file_stat_string"):
+                yield self._generate_file_stat_string()
+            else:
+                yield from self._iter_file_stat_fragments()
+            yield "\n"
+        yield self._generate_overall_stat_string()
 
-            if file_coverage_stat.ignored_nodes is not None:
-                for ignored_node in file_coverage_stat.ignored_nodes:
-                    file_string += " - Ignored `{0}`: reason: `{1}`\n".format(
-                        ignored_node.identifier,
-                        ignored_node.reason,
-                    )
+    def _overrides(self, method_name: str) -> bool:
+        """Whether the class of this printer overrides the `LegacyPrinter` method `method_name`.
+        `_generate_string` and `_generate_file_stat_string` are the methods subclasses override
+        to customize the report: Such overrides are used instead of the fragment generators."""
+        return getattr(type(self), method_name) is not getattr(LegacyPrinter, method_name)
 
-            if file_coverage_stat.nodes_without_docstring is not None:
-                for node_identifier in file_coverage_stat.nodes_without_docstring:
-                    if node_identifier == "module docstring":
-                        file_string += " - No module docstring\n"
+    def _generate_file_stat_string(self) -> str:
+        return "".join(self._iter_file_stat_fragments())
+
+    def _iter_file_stat_fragments(self) -> Iterator[str]:
+        # Fragments are yielded one at a time and joined (or written) by the caller: Repeated string
+        #   concatenation would copy the whole (potentially large) report for every added fragment
+        # Unpack each (named-tuple) stat once instead of looking up its fields repeatedly
+        for (
+            coverage,
+            found,
+            missing,
+            needed,
+            path,
+            ignored_nodes,
+            is_empty,
+            nodes_with_docstring,
+            nodes_without_docstring,
+        ) in self.iter_files_coverage_stat():
+
+            yield f'\nFile: "{path}"\n'
+
+            if is_empty is True:
+                yield " - File is empty\n"
+
+            if nodes_with_docstring is not None:
+                for node_identifier in nodes_with_docstring:
+                    yield f" - Found docstring for `{node_identifier}`\n"
+
+            if ignored_nodes is not None:
+                for identifier, reason in ignored_nodes:
+                    yield f" - Ignored `{identifier}`: reason: `{reason}`\n"
+
+            if nodes_without_docstring is not None:
+                for node_identifier in nodes_without_docstring:
+                    if node_identifier == MODULE_DOCSTRING_IDENTIFIER:
+                        yield " - No module docstring\n"
                     else:
-                        file_string += " - No docstring for `{0}`\n".format(node_identifier)
-
-            file_string += " Needed: %s; Found: %s; Missing: %s; Coverage: %.1f%%" % (
-                file_coverage_stat.needed,
-                file_coverage_stat.found,
-                file_coverage_stat.missing,
-                file_coverage_stat.coverage,
-            )
+                        yield f" - No docstring for `{node_identifier}`\n"
 
-            final_string += "\n" + file_string + "\n"
+            yield f" Needed: {needed}; Found: {found}; Missing: {missing};"
+            yield f" Coverage: {coverage:.1f}%\n"
 
-        return final_string + "\n"
+        yield "\n"
 
     def _generate_overall_stat_string(self) -> str:
         if isinstance(self.overall_coverage_stat, float):
             return str(self.overall_coverage_stat)
 
-        prefix: str = ""
+        prefix_parts: List[str] = []
 
         if self.overall_coverage_stat.num_empty_files > 0:
-            prefix += " (%s files are empty)" % self.overall_coverage_stat.num_empty_files
-
-        if self.overall_coverage_stat.is_skip_magic:
-            prefix += " (skipped all non-init magic methods)"
-
-        if self.overall_coverage_stat.is_skip_file_docstring:
-            prefix += " (skipped file-level docstrings)"
-
-        if self.overall_coverage_stat.is_skip_init:
-            prefix += " (skipped __init__ methods)"
+            prefix_parts.append(f" ({self.overall_coverage_stat.num_empty_files} files are empty)")
 
-        if self.overall_coverage_stat.is_skip_class_def:
-            prefix += " (skipped class definitions)"
+        prefix_parts.append(_LEGACY_SKIP_POSTFIXES[self.ignore_config.skip_mask])
 
-        if self.overall_coverage_stat.is_skip_private:
-            prefix += " (skipped private methods)"
-
-        final_string: str = ""
+        prefix: str = "".join(prefix_parts)
 
         if self.overall_coverage_stat.num_files > 1:
-            final_string += "Overall statistics for %s files%s:\n" % (
-                self.overall_coverage_stat.num_files,
-                prefix,
-            )
+            header = f"Overall statistics for {self.overall_coverage_stat.num_files} files{prefix}:"
         else:
-            final_string += "Overall statistics%s:\n" % prefix
-
-        final_string += "Needed: {}  -  Found: {}  -  Missing: {}\n".format(
-            self.overall_coverage_stat.needed,
-            self.overall_coverage_stat.found,
-            self.overall_coverage_stat.missing,
+            header = f"Overall statistics{prefix}:"
+
+        return "".join(
+            [
+                header,
+                "\n",
+                f"Needed: {self.overall_coverage_stat.needed}  -  "
+                f"Found: {self.overall_coverage_stat.found}  -  "
+                f"Missing: {self.overall_coverage_stat.missing}\n",
+                f"Total coverage: {self.overall_coverage_stat.total_coverage:.1f}%  -  "
+                f"Grade: {self.overall_coverage_stat.grade}",
+            ]
         )
 
-        final_string += "Total coverage: {:.1f}%  -  Grade: {}".format(
-            self.overall_coverage_stat.total_coverage,
-            self.overall_coverage_stat.grade,
-        )
-
-        return final_string
-
 
 class MarkdownPrinter(LegacyPrinter):
     """Printer for Markdown format."""
@@ -354,115 +467,106 @@ class MarkdownPrinter(LegacyPrinter):
     def save_to_file(self, path: Optional[str] = None) -> None:
         if path is None:
             path = "./coverage-results.md"
-        with open(path, "w") as wf:
-            wf.write(self._generate_string())
-
-    def _generate_file_stat_string(self) -> str:
-        final_string: str = ""
-        for file_coverage_stat in self.overall_files_coverage_stat:
-
-            file_string: str = "**File**: `{0}`\n".format(file_coverage_stat.path)
-
-            if file_coverage_stat.is_empty is not None and file_coverage_stat.is_empty is True:
-                file_string += "- File is empty\n"
-
-            if file_coverage_stat.nodes_with_docstring is not None:
-                for node_identifier in file_coverage_stat.nodes_with_docstring:
-                    file_string += "- Found docstring for `{0}`\n".format(
-                        node_identifier,
-                    )
-
-            if file_coverage_stat.ignored_nodes is not None:
-                for ignored_node in file_coverage_stat.ignored_nodes:
-                    file_string += "- Ignored `{0}`: reason: `{1}`\n".format(
-                        ignored_node.identifier,
-                        ignored_node.reason,
-                    )
-
-            if file_coverage_stat.nodes_without_docstring is not None:
-                for node_identifier in file_coverage_stat.nodes_without_docstring:
-                    if node_identifier == "module docstring":
-                        file_string += "- No module docstring\n"
+        self._write_to_file(path)
+
+    def _iter_file_stat_fragments(self) -> Iterator[str]:
+        separator = ""
+        # Unpack each (named-tuple) stat once instead of looking up its fields repeatedly
+        for (
+            coverage,
+            found,
+            missing,
+            needed,
+            path,
+            ignored_nodes,
+            is_empty,
+            nodes_with_docstring,
+            nodes_without_docstring,
+        ) in self.iter_files_coverage_stat():
+
+            # Files are separated by an empty line
+            yield separator
+            separator = "\n"
+            yield f"**File**: `{path}`\n"
+
+            if is_empty is True:
+                yield "- File is empty\n"
+
+            if nodes_with_docstring is not None:
+                for node_identifier in nodes_with_docstring:
+                    yield f"- Found docstring for `{node_identifier}`\n"
+
+            if ignored_nodes is not None:
+                for identifier, reason in ignored_nodes:
+                    yield f"- Ignored `{identifier}`: reason: `{reason}`\n"
+
+            if nodes_without_docstring is not None:
+                for node_identifier in nodes_without_docstring:
+                    if node_identifier == MODULE_DOCSTRING_IDENTIFIER:
+                        yield "- No module docstring\n"
                     else:
-                        file_string += "- No docstring for `{0}`\n".format(node_identifier)
+                        yield f"- No docstring for `{node_identifier}`\n"
 
-            file_string += "\n"
+            yield "\n"
 
-            file_string += self._generate_markdown_table(
+            yield self._generate_markdown_table(
                 ("Needed", "Found", "Missing", "Coverage"),
                 (
                     (
-                        file_coverage_stat.needed,
-                        file_coverage_stat.found,
-                        file_coverage_stat.missing,
-                        "{:.1f}%".format(file_coverage_stat.coverage),
+                        needed,
+                        found,
+                        missing,
+                        f"{coverage:.1f}%",
                     ),
                 ),
             )
+            yield "\n"
 
-            if final_string == "":
-                final_string += file_string + "\n"
-            else:
-                final_string += "\n" + file_string + "\n"
-
-        return final_string + "\n"
+        yield "\n"
 
     def _generate_overall_stat_string(self) -> str:
         if isinstance(self.overall_coverage_stat, float):
             return str(self.overall_coverage_stat)
 
-        final_string: str = "## Overall statistics\n"
+        parts: List[str] = ["## Overall statistics\n"]
 
         if self.overall_coverage_stat.num_files > 1:
-            final_string += "Files number: **{}**\n".format(self.overall_coverage_stat.num_files)
+            parts.append(f"Files number: **{self.overall_coverage_stat.num_files}**\n")
 
-        final_string += "\n"
+        parts.append("\n")
 
-        final_string += "Total coverage: **{:.1f}%**\n".format(
-            self.overall_coverage_stat.total_coverage,
-        )
+        parts.append(f"Total coverage: **{self.overall_coverage_stat.total_coverage:.1f}%**\n")
 
-        final_string += "\n"
+        parts.append("\n")
 
-        final_string += "Grade: **{}**\n".format(self.overall_coverage_stat.grade)
+        parts.append(f"Grade: **{self.overall_coverage_stat.grade}**\n")
 
         if self.overall_coverage_stat.num_empty_files > 0:
-            final_string += "- %s files are empty\n" % self.overall_coverage_stat.num_empty_files
-
-        if self.overall_coverage_stat.is_skip_magic:
-            final_string += "- skipped all non-init magic methods\n"
-
-        if self.overall_coverage_stat.is_skip_file_docstring:
-            final_string += "- skipped file-level docstrings\n"
+            parts.append(f"- {self.overall_coverage_stat.num_empty_files} files are empty\n")
 
-        if self.overall_coverage_stat.is_skip_init:
-            final_string += "- skipped __init__ methods\n"
+        parts.append(_MARKDOWN_SKIP_POSTFIXES[self.ignore_config.skip_mask])
 
-        if self.overall_coverage_stat.is_skip_class_def:
-            final_string += "- skipped class definitions\n"
+        parts.append("\n")
 
-        if self.overall_coverage_stat.is_skip_private:
-            final_string += "- skipped private methods\n"
-
-        final_string += "\n"
-
-        final_string += self._generate_markdown_table(
-            ("Needed", "Found", "Missing"),
-            (
+        parts.append(
+            self._generate_markdown_table(
+                ("Needed", "Found", "Missing"),
                 (
-                    self.overall_coverage_stat.needed,
-                    self.overall_coverage_stat.found,
-                    self.overall_coverage_stat.missing,
+                    (
+                        self.overall_coverage_stat.needed,
+                        self.overall_coverage_stat.found,
+                        self.overall_coverage_stat.missing,
+                    ),
                 ),
-            ),
+            )
         )
 
-        return final_string
+        return "".join(parts)
 
     def _generate_markdown_table(
         self,
         cols: Tuple[str, ...],
-        rows: Tuple[Tuple[Union[str, int, float]], ...],
+        rows: Iterable[Tuple[Union[str, int, float], ...]],
     ) -> str:
         """Generate markdown table.
 
@@ -483,29 +587,23 @@ class MarkdownPrinter(LegacyPrinter):
         ----------
         cols: Tuple[str, ...]
             Table columns
-        rows: Tuple[Tuple[Union[str, int, float]], ...]
-            Column values
+        rows: Iterable[Tuple[Union[str, int, float], ...]]
+            Column values. Any iterable (e.g. a generator) is accepted, as rows are consumed
+            (and validated) in a single pass
 
         Returns
         -------
         str
             Generated table.
         """
-        if not all(len(v) == len(cols) for v in rows):
-            raise ValueError("Col num not equal to cols value")
-        final_string: str = ""
-
-        for col in cols:
-            final_string += "| {} ".format(col)
-        final_string += "|\n"
-
-        for _ in range(len(cols)):
-            final_string += "|---"
-        final_string += "|\n"
+        num_cols = len(cols)
+        header = "| " + " | ".join(cols) + " |\n"
+        separator = "|" + "|".join(["---"] * num_cols) + "|\n"
 
+        row_strings: List[str] = []
         for row in rows:
-            for value in row:
-                final_string += "| {} ".format(value)
-            final_string += "|"
+            if len(row) != num_cols:
+                raise ValueError("Col num not equal to cols value")
+            row_strings.append("| " + " | ".join([str(value) for value in row]) + " |")
 
-        return final_string
+        return header + separator + "\n".join(row_strings)
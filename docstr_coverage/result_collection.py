@@ -3,10 +3,13 @@
 Currently, this module is in BETA and its interface may change in future versions."""
 import abc
 import enum
-import functools
-import operator
+import sys
 from typing import Optional
 
+# Identifier under which module docstrings are collected. Compare identifiers against it with `==`:
+#   Collected identifiers are interned, but interning is not preserved (e.g. by pickling).
+MODULE_DOCSTRING_IDENTIFIER = sys.intern("module docstring")
+
 
 class ResultCollection:
     """A result collection contains information about the presence of docstrings collected during
@@ -14,6 +17,8 @@ class ResultCollection:
     for inspected files can be retrieved, and summary metrics (e.g. coverage) can be extracted
     without having to walk over the files again."""
 
+    __slots__ = ("_files",)
+
     def __init__(self):
         self._files = dict()
 
@@ -49,8 +54,11 @@ class ResultCollection:
         -------
         AggregatedCount
             A count instance containing a range of docstring counts."""
-        counts = (file.count_aggregate() for file in self._files.values())
-        return functools.reduce(operator.add, counts, AggregatedCount())
+        # Accumulate in place, instead of creating a new AggregatedCount for each added file
+        aggregated = AggregatedCount()
+        for file in self._files.values():
+            aggregated._add_file_count(file.count_aggregate())
+        return aggregated
 
     def files(self):
         """View of all (file-name, file-info) tuples in this result collection"""
@@ -91,23 +99,15 @@ class ResultCollection:
                 e.node_identifier
                 for e in file.expected_docstrings()
                 if not (
-                    e.ignore_reason or e.has_docstring or e.node_identifier == "module docstring"
+                    e.ignore_reason
+                    or e.has_docstring
+                    or e.node_identifier == MODULE_DOCSTRING_IDENTIFIER
                 )
             ]
-            has_module_doc = (
-                len(
-                    [
-                        e
-                        for e in file.expected_docstrings()
-                        if e.node_identifier == "module docstring" and e.has_docstring
-                    ]
-                )
-                > 0
-            )
             count = file.count_aggregate()
             file_results[file_path] = {
                 "missing": missing_list,
-                "module_doc": has_module_doc,
+                "module_doc": file._has_module_doc,
                 "missing_count": count.missing,
                 "needed_count": count.needed,
                 "coverage": count.coverage(),
@@ -134,10 +134,26 @@ class FileStatus(enum.Enum):
 class File:
     """The information about docstrings for a single file."""
 
+    __slots__ = (
+        "_expected_docstrings",
+        "_status",
+        "_partitioned_nodes",
+        "_needed",
+        "_found",
+        "_missing",
+        "_has_module_doc",
+    )
+
     def __init__(self) -> None:
         super().__init__()
         self._expected_docstrings = []
         self._status = FileStatus.ANALYZED
+        self._partitioned_nodes = None
+        # Counts are maintained while docstrings are collected, such that counting is O(1)
+        self._needed = 0
+        self._found = 0
+        self._missing = 0
+        self._has_module_doc = False
 
     def collect_docstring(self, identifier: str, has_docstring: bool, ignore_reason: str = None):
         """Used internally by docstr-coverage to collect the status of a single, expected docstring.
@@ -152,11 +168,31 @@ class File:
             True if and only if the docstring was present
         ignore_reason: Optional[str]
             Used to indicate that the docstring should be ignored (independent of its presence)"""
+        self._partitioned_nodes = None
+        # Identifiers (e.g. `__init__`) and ignore reasons repeat a lot across files. Interning
+        #   them shares a single string object between all their occurrences. This only saves
+        #   memory: Identifiers must still be compared with `==`, as e.g. unpickled strings are
+        #   not interned (`str.__eq__` returns early for identical strings anyways).
+        if ignore_reason is not None:
+            ignore_reason = sys.intern(ignore_reason)
+        identifier = sys.intern(identifier)
         self._expected_docstrings.append(
             ExpectedDocstring(
-                node_identifier=identifier, has_docstring=has_docstring, ignore_reason=ignore_reason
+                node_identifier=identifier,
+                has_docstring=has_docstring,
+                ignore_reason=ignore_reason,
             )
         )
+        if identifier == MODULE_DOCSTRING_IDENTIFIER and has_docstring:
+            self._has_module_doc = True
+        if ignore_reason:
+            pass  # Ignores will be counted in a future version
+        elif has_docstring:
+            self._needed += 1
+            self._found += 1
+        else:
+            self._needed += 1
+            self._missing += 1
 
     def collect_module_docstring(self, has_docstring: bool, ignore_reason: str = None):
         """Used internally by docstr-coverage to collect the status of a module docstring.
@@ -168,13 +204,39 @@ class File:
         ignore_reason: Optional[str]
             Used to indicate that the docstring should be ignored (independent of its presence)"""
         self.collect_docstring(
-            identifier="module docstring", has_docstring=has_docstring, ignore_reason=ignore_reason
+            identifier=MODULE_DOCSTRING_IDENTIFIER,
+            has_docstring=has_docstring,
+            ignore_reason=ignore_reason,
         )
 
     def expected_docstrings(self):
         """A generator, iterating over all reported (present or missing) docstrings in this file"""
         return iter(self._expected_docstrings)
 
+    @property
+    def partitioned_nodes(self):
+        """The identifiers of all reported docstrings in this file, partitioned (in a single pass)
+        by their state. The partition is computed upon first access and cached until another
+        docstring is collected. The returned lists are shared with the cache: Do not modify them.
+
+        Returns
+        -------
+        Tuple
+            Triple of lists: The identifiers of present docstrings, the identifiers of missing
+            docstrings, and (identifier, ignore_reason) pairs of ignored docstrings"""
+        if self._partitioned_nodes is None:
+            with_docstring, without_docstring, ignored = [], [], []
+            for expd in self._expected_docstrings:
+                identifier, ignore_reason = expd.node_identifier, expd.ignore_reason
+                if ignore_reason:
+                    ignored.append((identifier, ignore_reason))
+                elif expd.has_docstring:
+                    with_docstring.append(identifier)
+                else:
+                    without_docstring.append(identifier)
+            self._partitioned_nodes = (with_docstring, without_docstring, ignored)
+        return self._partitioned_nodes
+
     @property
     def status(self) -> FileStatus:
         return self._status
@@ -192,34 +254,32 @@ class File:
         self._status = status
 
     def count_aggregate(self):
-        """Walks through all docstring reports of this file and counts them by state
-        (e.g. the #missing).
+        """Counts the docstring reports of this file by state (e.g. the #missing).
+        The counts are tracked while collecting the docstrings, thus this does not walk the reports.
 
         Returns
         -------
         FileCount
             A count instance containing a range of docstring counts."""
         count = FileCount()
-        if self._status == FileStatus.EMPTY:
+        if self._status is FileStatus.EMPTY:
             count.found_empty_file()
         else:
-            for expd in self._expected_docstrings:
-                if expd.ignore_reason:
-                    pass  # Ignores will be counted in a future version
-                elif expd.has_docstring:
-                    count.found_needed_docstr()
-                else:
-                    count.missed_needed_docstring()
+            count.needed = self._needed
+            count.found = self._found
+            count.missing = self._missing
         return count
 
 
 class ExpectedDocstring:
     """A class containing information about a single docstring and its presence"""
 
+    # One instance is created per expected docstring: Slots avoid a `__dict__` for each of them
+    __slots__ = ("node_identifier", "has_docstring", "ignore_reason")
+
     def __init__(
         self, node_identifier: str, has_docstring: bool, ignore_reason: Optional[str]
     ) -> None:
-        super().__init__()
         self.node_identifier = node_identifier
         self.has_docstring = has_docstring
         self.ignore_reason = ignore_reason
@@ -232,6 +292,9 @@ class _DocstrCount(abc.ABC):
     Do not directly create instances of this abstract superclass (even though
     it has no abstract methods)."""
 
+    # Counts are created for every file: Slots avoid a `__dict__` for each of them
+    __slots__ = ("needed", "found", "missing")
+
     def __init__(self, needed: int, found: int, missing: int):
         # Note: In the future, we'll add `self.ignored` here
         self.needed = needed
@@ -250,6 +313,8 @@ class _DocstrCount(abc.ABC):
 class AggregatedCount(_DocstrCount):
     """Counts of docstrings by presence, such as #missing, representing a list of files"""
 
+    __slots__ = ("num_files", "num_empty_files")
+
     def __init__(
         self,
         num_files: int = 0,
@@ -263,24 +328,18 @@ class AggregatedCount(_DocstrCount):
         self.num_empty_files = num_empty_files
 
     def __add__(self, other):
-        if isinstance(other, _DocstrCount):
-            aggregated = AggregatedCount(
-                needed=self.needed + other.needed,
-                found=self.found + other.found,
-                missing=self.missing + other.missing,
+        # Dispatch with a single type check for the supported operand types
+        if isinstance(other, FileCount):
+            num_files = self.num_files + 1
+            num_empty_files = self.num_empty_files + int(other.is_empty)
+        elif isinstance(other, AggregatedCount):
+            num_files = self.num_files + other.num_files
+            num_empty_files = self.num_empty_files + other.num_empty_files
+        elif isinstance(other, _DocstrCount):
+            raise NotImplementedError(
+                "Received unexpected DocstrCount subtype ({}). "
+                "Please report to docstr-coverage issue tracker.".format(type(other))
             )
-            if isinstance(other, AggregatedCount):
-                aggregated.num_files = self.num_files + other.num_files
-                aggregated.num_empty_files = self.num_empty_files + other.num_empty_files
-            elif isinstance(other, FileCount):
-                aggregated.num_files = self.num_files + 1
-                aggregated.num_empty_files = self.num_empty_files + int(other.is_empty)
-            else:
-                raise NotImplementedError(
-                    "Received unexpected DocstrCount subtype ({}). "
-                    "Please report to docstr-coverage issue tracker.".format(type(other))
-                )
-            return aggregated
         else:
             # Chosen NotImplementedError over TypeError as specified in
             #   https://docs.python.org/3/reference/datamodel.html#object.__add__ :
@@ -290,6 +349,26 @@ class AggregatedCount(_DocstrCount):
                 "Can only add _Count and _AggregatedCount instances to a _AggregatedCount instance"
                 " but received {}".format(type(other))
             )
+        return AggregatedCount(
+            num_files=num_files,
+            num_empty_files=num_empty_files,
+            needed=self.needed + other.needed,
+            found=self.found + other.found,
+            missing=self.missing + other.missing,
+        )
+
+    def _add_file_count(self, file_count):
+        """Adds the counts of a single file to this count in place.
+
+        Parameters
+        ----------
+        file_count: FileCount
+            The counts of the file to add"""
+        self.num_files += 1
+        self.num_empty_files += int(file_count.is_empty)
+        self.needed += file_count.needed
+        self.found += file_count.found
+        self.missing += file_count.missing
 
     def __eq__(self, other):
         if isinstance(other, AggregatedCount):
@@ -306,6 +385,8 @@ class AggregatedCount(_DocstrCount):
 class FileCount(_DocstrCount):
     """Counts of docstrings by presence, such as #missing, representing a single file"""
 
+    __slots__ = ("is_empty",)
+
     def __init__(self) -> None:
         super().__init__(needed=0, found=0, missing=0)
         self.is_empty = False
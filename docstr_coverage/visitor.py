@@ -1,130 +1,187 @@
 """This module handles traversing abstract syntax trees to check for docstrings"""
 import re
 import tokenize
-from ast import (
-    AsyncFunctionDef,
-    ClassDef,
-    FunctionDef,
-    Module,
-    NodeVisitor,
-    get_docstring,
-)
+from ast import AST, AsyncFunctionDef, ClassDef, FunctionDef, Module, get_docstring
+from io import StringIO
 from typing import Optional
 
 ACCEPTED_EXCUSE_PATTERNS = (
     re.compile(r"#\s*docstr-coverage\s*:\s*inherit(ed)?\s*"),
     re.compile(r"#\s*docstr-coverage\s*:\s*excuse(d)?\s* `.*`\s*"),
 )
+# All accepted excuse patterns as a single alternation, such that a comment is matched only once
+_EXCUSE_PATTERN = re.compile("|".join("(?:{})".format(p.pattern) for p in ACCEPTED_EXCUSE_PATTERNS))
+# Types of tokens (i.e., line breaks) which are expected between an excuse and a node start
+_SKIP_TOKEN_TYPES = frozenset((tokenize.NL, tokenize.NEWLINE))
 
+# The nodes for which a docstring is expected (besides the module itself)
+_DEFINITION_TYPES = (ClassDef, FunctionDef, AsyncFunctionDef)
+# The fields of AST nodes which may hold (lists of) statements, in the order of `ast.iter_fields`.
+#   Definitions are statements, thus they cannot be found in any other field (e.g. expressions)
+_NESTED_STATEMENT_FIELDS = ("body", "handlers", "orelse", "finalbody", "cases")
+# The relevant decorators, by the name they are referenced with (e.g. `@property`), and by the
+#   attribute they are referenced with (e.g. `@x.setter`)
+_NAME_DECORATORS = {"property": "@property"}
+_ATTRIBUTE_DECORATORS = {"setter": "@setter", "deleter": "@deleter"}
 
-class DocStringCoverageVisitor(NodeVisitor):
-    """Class to visit nodes, determine whether a node requires a docstring,
-    and to check for the existence of a docstring"""
 
-    def __init__(self, filename):
+class Node:
+    """A class or function definition, as collected in :attr:`DocStringCoverageVisitor.tree`"""
+
+    # One instance is created per definition: Slots avoid a `__dict__` for each of them
+    __slots__ = ("name", "has_doc", "decorator", "children")
+
+    def __init__(self, name: str, has_doc: bool, decorator: Optional[str]):
+        self.name = name
+        self.has_doc = has_doc
+        self.decorator = decorator
+        # The definitions nested within this definition
+        self.children = []
+
+
+class ModuleNode(Node):
+    """The module (i.e., the file) at the root of :attr:`DocStringCoverageVisitor.tree`"""
+
+    __slots__ = ("is_empty",)
+
+    def __init__(self, has_doc: bool, is_empty: bool):
+        super().__init__(name="<module>", has_doc=has_doc, decorator=None)
+        self.is_empty = is_empty
+
+
+class DocStringCoverageVisitor:
+    """Class to visit nodes, determine whether a node requires a docstring,
+    and to check for the existence of a docstring.
+
+    Instead of visiting every node of the tree (as an `ast.NodeVisitor` would), only the nested
+    statements are walked, which is where class and function definitions can be found."""
+
+    def __init__(self, filename, source: Optional[str] = None):
+        """
+        Parameters
+        ----------
+        filename: String
+            Path of the file to visit
+        source: String, or None
+            The contents of the file, if they were already read (e.g., to be parsed). If None,
+            the file is read"""
         self.filename = filename
-        with open(filename, "rb") as file:
-            self.tokens = list(tokenize.tokenize(file.readline))
+        if source is None:
+            with tokenize.open(filename) as file:
+                source = file.read()
+        # The lines on which a definition is excused by a comment above it
+        self._excused_lines = set()
+        # Lines of decorators, whose tokens are expected between an excuse and a node
+        self._decorator_lines = set()
+        # Tokens are only needed to find excuse comments: Files without any are not tokenized
+        if "docstr-coverage" in source:
+            self._collect_excused_lines(tokenize.generate_tokens(StringIO(source).readline))
         self.symbol_count = 0
         self.tree = []
 
+    def visit(self, node: AST):
+        """Visit `node` (typically, the `Module` of a parsed file) and all definitions within.
+        Definitions outside of a module are added to the last visited module."""
+        if isinstance(node, Module):
+            self.visit_Module(node)
+        elif isinstance(node, _DEFINITION_TYPES):
+            self._visit_helper(node, self.tree[-1].children)
+        else:
+            self.generic_visit(node)
+
+    def generic_visit(self, node: AST):
+        """Visit all definitions in the statements nested (at any depth) within `node`, e.g. in the
+        body of a function or in the branches of an `if` statement."""
+        self._walk(node, self.tree[-1].children)
+
     def visit_Module(self, node: Module):
         """Upon visiting a module, initialize :attr:`DocStringCoverageVisitor.tree`
         with module-wide node info."""
-        has_doc = self._has_docstring(node)
-        is_empty = not len(node.body)
-        self.tree.append((has_doc, is_empty, None, []))
-        self.generic_visit(node)
-
-    def visit_ClassDef(self, node: ClassDef):
-        """Collect information regarding class declaration nodes"""
-        self._visit_helper(node)
-
-    def visit_FunctionDef(self, node: FunctionDef):
-        """Collect information regarding function/method declaration nodes"""
-        self._visit_helper(node)
-
-    def visit_AsyncFunctionDef(self, node: AsyncFunctionDef):
-        """Collect information regarding async function/method declaration nodes"""
-        self._visit_helper(node)
-
-    def _visit_helper(self, node):
-        """Helper method to update :attr:`DocStringCoverageVisitor.tree` with pertinent
-        documentation information for `node`, then ensure all child nodes are
-        also visited"""
+        module_node = ModuleNode(has_doc=self._has_docstring(node), is_empty=not len(node.body))
+        self.tree.append(module_node)
+        self._walk(node, module_node.children)
+
+    def _walk(self, node: AST, children: list):
+        """Recursively walk the statements nested within `node`, and collect the definitions
+        found (at any depth) into `children`, the list of children of `node`'s tree node"""
+        for field in _NESTED_STATEMENT_FIELDS:
+            for child in getattr(node, field, ()):
+                if isinstance(child, _DEFINITION_TYPES):
+                    self._visit_helper(child, children)
+                else:
+                    self._walk(child, children)
+
+    def _visit_helper(self, node, children: list):
+        """Helper method to add a node with pertinent documentation information for `node` to
+        `children` (i.e., to :attr:`DocStringCoverageVisitor.tree`), then ensure all child nodes
+        are also visited"""
         self.symbol_count += 1
-        has_doc = self._has_doc_or_excuse(node)
-        relevant_decorator = self._relevant_decorator(node)
-        _node = (node.name, has_doc, relevant_decorator, [])
-        self.tree[-1][-1].append(_node)
-        self.tree.append(_node)
-        self.generic_visit(node)
-        self.tree.pop()
+        definition_node = Node(
+            name=node.name,
+            has_doc=self._has_doc_or_excuse(node),
+            decorator=self._relevant_decorator(node),
+        )
+        children.append(definition_node)
+        # Nested definitions are collected directly into this node's list of children
+        self._walk(node, definition_node.children)
 
     def _has_doc_or_excuse(self, node):
         """Evaluates if the passed node has a corresponding docstring
         or if there is an excuse comment"""
-        return self._has_docstring(node=node) or self._has_excuse(node=node)
+        # Same as `_has_docstring`, inlined as this is called for every definition
+        docstring = get_docstring(node, clean=False)
+        return (docstring is not None and docstring.strip() != "") or self._has_excuse(node)
 
     @staticmethod
     def _is_excuse_token(token):
         """Evaluates whether the given `tokenize.token` represents a valid excuse comment"""
-        return token.type == tokenize.COMMENT and any(
-            regex.match(token.string) for regex in ACCEPTED_EXCUSE_PATTERNS
-        )
+        return token.type == tokenize.COMMENT and _EXCUSE_PATTERN.match(token.string) is not None
 
-    @staticmethod
-    def _is_skip_token(token):
+    def _is_skip_token(self, token):
         """Evaluates, for the given tokenize.token,
         if said token is expected between a node start and an excuse token"""
         return (
-            token.type == tokenize.NL
-            or token.type == tokenize.NEWLINE
+            token.type in _SKIP_TOKEN_TYPES
             or (token.type == tokenize.NAME and token.string == "class")
-            or token.line.strip().startswith("@")
+            or token.start[0] in self._decorator_lines
         )
 
+    def _collect_excused_lines(self, tokens):
+        """Finds, in a single pass through the tokenize `tokens`, the lines on which a definition
+        is excused: Those whose first token is preceded by an excuse comment, with only tokens
+        which we expect to see between excuse and node start (see `_is_skip_token`) in between"""
+        # Whether the last token which is not a skip token is an excuse (False at the top of file)
+        excused = False
+        lineno = None
+        for token in tokens:
+            if token.start[0] != lineno:
+                # The first token on its line: Record whether a node starting here is excused
+                lineno = token.start[0]
+                if excused:
+                    self._excused_lines.add(lineno)
+                if token.line.lstrip().startswith("@"):
+                    self._decorator_lines.add(lineno)
+            if not self._is_skip_token(token):
+                excused = self._is_excuse_token(token)
+
     def _has_excuse(self, node):
-        """Iterates through the tokenize tokens above the passed node to evaluate whether a
-        doc-missing excuse has been placed (right) above this nodes begin"""
-        node_start = node.lineno
-
-        # Find the index of first token which starts at the same line as the node
-        token_index = -1
-        for i, t in enumerate(self.tokens):
-            if t.start[0] == node_start:
-                token_index = i - 1
-                break
-
-        # Iterate downwards on token index
-        #   (i.e., skip tokens which we expect to see between excuse and node start)
-        #   until we find either an excuse
-        #   or some token which shows that there was no excuse present.
-        while token_index >= 0:
-            as_token = self.tokens[token_index]
-            if self._is_skip_token(as_token):
-                token_index -= 1
-            else:
-                return self._is_excuse_token(as_token)
-        # Reached the top of the file
-        return False
+        """Evaluates whether a doc-missing excuse has been placed (right) above this nodes begin"""
+        return node.lineno in self._excused_lines
 
     @staticmethod
     def _has_docstring(node):
         """Uses ast to check if the passed node contains a non-empty docstring"""
-        return get_docstring(node) is not None and get_docstring(node).strip() != ""
+        # Cleaning the docstring (i.e., removing its indentation) does not change whether it is
+        #   empty, so it is skipped
+        docstring = get_docstring(node, clean=False)
+        return docstring is not None and docstring.strip() != ""
 
     @staticmethod
     def _relevant_decorator(node) -> Optional[str]:
-        if hasattr(node, "decorator_list"):
-            for parsed_decorator in node.decorator_list:
-                if hasattr(parsed_decorator, "id"):
-                    if parsed_decorator.id == "property":
-                        return "@property"
-                if hasattr(parsed_decorator, "attr"):
-                    if parsed_decorator.attr == "setter":
-                        return "@setter"
-                if hasattr(parsed_decorator, "attr"):
-                    if parsed_decorator.attr == "deleter":
-                        return "@deleter"
+        for decorator in getattr(node, "decorator_list", ()):
+            relevant = _NAME_DECORATORS.get(getattr(decorator, "id", None))
+            if relevant is None:
+                relevant = _ATTRIBUTE_DECORATORS.get(getattr(decorator, "attr", None))
+            if relevant is not None:
+                return relevant
         return None
@@ -0,0 +1,49 @@
+"""Definitions nested in compound statements, which must all be found"""
+import sys
+
+if sys.version_info >= (3, 8):
+
+    def in_if():
+        """Docstring"""
+
+else:
+
+    def in_else():
+        pass
+
+
+try:
+
+    def in_try():
+        pass
+
+except ImportError:
+
+    def in_except():
+        """Docstring"""
+
+else:
+
+    class InTryElse:
+        """Docstring"""
+
+        for _ in range(1):
+
+            def in_class_for(self):
+                pass
+
+finally:
+
+    def in_finally():
+        pass
+
+
+def outer():
+    """Docstring"""
+    with open(__file__):
+        while True:
+
+            def in_while():
+                pass
+
+            break
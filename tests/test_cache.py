@@ -0,0 +1,88 @@
+"""Tests for :mod:`docstr_coverage.cache`"""
+import json
+import os
+
+from docstr_coverage import analyze, coverage
+from docstr_coverage.cache import FileCache
+from docstr_coverage.visitor import ModuleNode, Node
+
+PARTLY_DOCUMENTED_FILE_PATH = os.path.join(
+    "tests", "sample_files", "subdir_a", "partly_documented_file.py"
+)
+
+
+def _module_tree():
+    """A visited module, with a nested definition and a decorated definition"""
+    tree = ModuleNode(has_doc=True, is_empty=False)
+    cls = Node(name="MyClass", has_doc=False, decorator=None)
+    cls.children.append(Node(name="my_property", has_doc=True, decorator="@property"))
+    tree.children.append(cls)
+    tree.children.append(Node(name="my_function", has_doc=True, decorator=None))
+    return tree
+
+
+def _as_tuple(node):
+    """The attributes of `node` and (recursively) its children, for comparison"""
+    return (
+        node.name,
+        node.has_doc,
+        node.decorator,
+        getattr(node, "is_empty", None),
+        [_as_tuple(c) for c in node.children],
+    )
+
+
+def test_get_put(tmpdir):
+    """Test that results are cached by file state, and that changing a file invalidates them"""
+    source_file = tmpdir.join("module.py")
+    source_file.write("x = 1\n")
+    cache = FileCache(cache_dir=str(tmpdir.join("cache")))
+
+    key = cache.key(str(source_file))
+    assert cache.get(key) is None
+    cache.put(key, _module_tree())
+    cached = cache.get(key)
+    assert isinstance(cached, ModuleNode)
+    assert isinstance(cached.children[0].children[0], Node)
+    assert _as_tuple(cached) == _as_tuple(_module_tree())
+    # A new instance reads the entries from disk
+    cached = FileCache(cache_dir=str(tmpdir.join("cache"))).get(key)
+    assert _as_tuple(cached) == _as_tuple(_module_tree())
+
+    source_file.write("x = 12\n")
+    assert cache.get(cache.key(str(source_file))) is None
+
+
+def test_get_corrupt_entry(tmpdir):
+    """Test that entries which cannot be read as a module tree are treated as missing"""
+    source_file = tmpdir.join("module.py")
+    source_file.write("x = 1\n")
+    cache = FileCache(cache_dir=str(tmpdir.join("cache")))
+    key = cache.key(str(source_file))
+    cache.put(key, _module_tree())
+
+    entry_path = cache._entry_path(key)
+    with open(entry_path) as f:
+        cached_key, has_doc, is_empty, _children = json.load(f)
+    for content in (
+        "[1, 2",  # Truncated
+        '{"__reduce__": null}',  # Not a list
+        json.dumps([cached_key, has_doc, is_empty, [["MyClass", False]]]),  # Malformed node
+    ):
+        with open(entry_path, "w") as f:
+            f.write(content)
+        assert cache.get(key) is None
+
+
+def test_analyze_with_cache(tmpdir, mocker):
+    """Test that files are visited only once when analyzed repeatedly with a cache,
+    and that the results read from the cache are the same as the visited ones"""
+    cache = FileCache(cache_dir=str(tmpdir))
+    visit_spy = mocker.spy(coverage, "_visit_file")
+
+    uncached = analyze([PARTLY_DOCUMENTED_FILE_PATH], show_progress=False)
+    first = analyze([PARTLY_DOCUMENTED_FILE_PATH], show_progress=False, cache=cache)
+    second = analyze([PARTLY_DOCUMENTED_FILE_PATH], show_progress=False, cache=cache)
+
+    assert visit_spy.call_count == 2
+    assert first.to_legacy() == second.to_legacy() == uncached.to_legacy()
@@ -530,6 +530,38 @@ def test_property_flags(
     assert float(run_result.stdout) == expected_coverage
 
 
+@pytest.mark.parametrize(
+    ["flags"],
+    [
+        pytest.param(["--jobs", "2"], id="jobs"),
+        pytest.param(["-j", "0"], id="jobs per CPU (short: -j)"),
+    ],
+)
+@pytest.mark.usefixtures("cd_tests_dir_fixture")
+def test_jobs(flags: List[str], runner: CliRunner):
+    """Test that parsing the files in multiple processes reports the same coverage"""
+    paths = [SAMPLES_DIR, "--percentage-only"]
+    sequential = runner.invoke(execute, paths)
+    parallel = runner.invoke(execute, paths + flags)
+    assert parallel.exit_code == sequential.exit_code
+    assert float(parallel.stdout) == float(sequential.stdout)
+
+
+@pytest.mark.usefixtures("cd_tests_dir_fixture")
+def test_cache(runner: CliRunner, tmpdir, monkeypatch):
+    """Test that `--cache` stores the parsed files in the user's cache directory,
+    and that runs using the cache report the same coverage"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmpdir))
+    paths = [SAMPLES_A.dirpath, "--percentage-only"]
+    uncached = runner.invoke(execute, paths)
+    assert not tmpdir.listdir()
+
+    first_run = runner.invoke(execute, paths + ["--cache"])
+    assert tmpdir.join("docstr_coverage").check(dir=True)
+    second_run = runner.invoke(execute, paths + ["--cache"])
+    assert float(uncached.stdout) == float(first_run.stdout) == float(second_run.stdout)
+
+
 ##################################################
 # Deprecation Tests
 ##################################################
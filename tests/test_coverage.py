@@ -1,5 +1,6 @@
 import logging
 import os
+import pickle
 import platform
 
 import pytest
@@ -24,6 +25,21 @@ PRIVATE_NO_DOCS_PATH = os.path.join(SAMPLES_C_DIRECTORY, "private_undocumented.p
 INDIVIDUAL_SAMPLES_DIR = os.path.join("tests", "individual_samples")
 
 
+@pytest.fixture(autouse=True)
+def _capture_printer_logs(caplog):
+    """The printers' logger does not propagate its records to the root logger (where `caplog`
+    captures them), thus `caplog` is attached to it directly"""
+    printers_logger = logging.getLogger("docstr_coverage.printers")
+    printers_logger.addHandler(caplog.handler)
+    yield
+    printers_logger.removeHandler(caplog.handler)
+
+
+def _logged_lines(caplog):
+    """Split the messages logged by a printer (which logs its whole report at once) into lines"""
+    return "\n".join(caplog.messages).split("\n")
+
+
 def test_should_report_for_an_empty_file():
     result = analyze([EMPTY_FILE_PATH])
     file_results, total_results = result.to_legacy()
@@ -121,6 +137,21 @@ def test_should_report_for_multiple_files():
     assert total_results == {"missing_count": 4, "needed_count": 16, "coverage": 75.0}
 
 
+def test_should_report_same_with_multiple_jobs():
+    """Files visited in worker processes are reported (in order) as if visited sequentially"""
+    filenames = [
+        PARTLY_DOCUMENTED_FILE_PATH,
+        DOCUMENTED_FILE_PATH,
+        EMPTY_FILE_PATH,
+        FULLY_EXCUSED_FILE_PATH,
+        PARTLY_EXCUSED_FILE_PATH,
+    ]
+    sequential = analyze(filenames, show_progress=False)
+    parallel = analyze(filenames, show_progress=False, jobs=2)
+    assert list(parallel.to_legacy()[0]) == filenames
+    assert parallel.to_legacy() == sequential.to_legacy()
+
+
 def test_should_report_when_no_docs_in_a_file():
     result = analyze([SOME_CODE_NO_DOCS_FILE_PATH])
     file_results, total_results = result.to_legacy()
@@ -165,9 +196,74 @@ def test_legacy_printer_logging_empty_file(caplog, expected):
         _file_results, _total_results = result.to_legacy()
 
     if platform.system() == "Windows":
-        assert [m.replace("\\", "/") for m in caplog.messages] == expected
+        assert [m.replace("\\", "/") for m in _logged_lines(caplog)] == expected
     else:
-        assert caplog.messages == expected
+        assert _logged_lines(caplog) == expected
+
+
+def test_printer_skips_generation_if_logging_disabled(caplog, mocker):
+    """The report must not be generated if the printer's logger does not emit INFO records"""
+    generate_string = mocker.patch.object(LegacyPrinter, "_generate_string", return_value="")
+    with caplog.at_level(logging.WARNING, logger="docstr_coverage.printers"):
+        LegacyPrinter(analyze([EMPTY_FILE_PATH]), verbosity=4).print_to_stdout()
+    generate_string.assert_not_called()
+    assert caplog.messages == []
+
+
+def test_printer_generates_report_once(tmpdir, mocker):
+    """Printing and saving the same report must generate its file statistics only once"""
+    printer = LegacyPrinter(analyze([EMPTY_FILE_PATH]), verbosity=4)
+    iter_file_stat_fragments = mocker.spy(printer, "_iter_file_stat_fragments")
+    printer.print_to_stdout()
+    printer.save_to_file(tmpdir.join("coverage-result.txt").strpath)
+    assert iter_file_stat_fragments.call_count == 1
+
+
+def test_printer_uses_overridden_generators(tmpdir, caplog):
+    """Overrides of `_generate_string` and `_generate_file_stat_string` by subclasses must be used
+    both when printing and when saving the report"""
+
+    class FileStatPrinter(LegacyPrinter):
+        def _generate_file_stat_string(self):
+            return "Custom file stats\n"
+
+    class StringPrinter(LegacyPrinter):
+        def _generate_string(self):
+            return "Custom report"
+
+    result = analyze([EMPTY_FILE_PATH])
+    for printer, expected in (
+        (FileStatPrinter(result, verbosity=4), "Custom file stats\n\n"),
+        (StringPrinter(result, verbosity=4), "Custom report"),
+    ):
+        caplog.clear()
+        printer.print_to_stdout()
+        path = tmpdir.join("coverage-result.txt").strpath
+        printer.save_to_file(path)
+        with open(path) as file:
+            saved = file.read()
+        assert caplog.messages[0].startswith(expected)
+        assert saved == caplog.messages[0]
+        # Saving a new printer's report (i.e., without printing it first)
+        type(printer)(result, verbosity=4).save_to_file(path)
+        with open(path) as file:
+            assert file.read() == saved
+
+
+def test_markdown_table():
+    """Rows of markdown tables are written on separate lines and validated against the columns"""
+    printer = MarkdownPrinter(analyze([EMPTY_FILE_PATH]), verbosity=4)
+    table = printer._generate_markdown_table(
+        ("Needed", "Found", "Missing"), ((10, 20, "65.5%"), (30, 40, "99.9%"))
+    )
+    assert table.split("\n") == [
+        "| Needed | Found | Missing |",
+        "|---|---|---|",
+        "| 10 | 20 | 65.5% |",
+        "| 30 | 40 | 99.9% |",
+    ]
+    with pytest.raises(ValueError):
+        printer._generate_markdown_table(("Needed", "Found"), ((10, 20, "65.5%"),))
 
 
 @pytest.mark.parametrize(
@@ -234,9 +330,9 @@ def test_markdown_printer_logging_empty_file(caplog, expected):
         _file_results, _total_results = result.to_legacy()
 
     if platform.system() == "Windows":
-        assert [m.replace("\\", "/") for m in caplog.messages] == expected
+        assert [m.replace("\\", "/") for m in _logged_lines(caplog)] == expected
     else:
-        assert caplog.messages == expected
+        assert _logged_lines(caplog) == expected
 
 
 @pytest.mark.parametrize(
@@ -357,9 +453,9 @@ def test_legacy_printer_logging_partially_documented_file(caplog, expected, verb
         LegacyPrinter(result, verbosity=verbose, ignore_config=ignore_config).print_to_stdout()
 
     if platform.system() == "Windows":
-        assert [m.replace("\\", "/") for m in caplog.messages] == expected
+        assert [m.replace("\\", "/") for m in _logged_lines(caplog)] == expected
     else:
-        assert caplog.messages == expected
+        assert _logged_lines(caplog) == expected
 
 
 @pytest.mark.parametrize(
@@ -479,9 +575,9 @@ def test_markdown_printer_logging_partially_documented_file(
         MarkdownPrinter(result, verbosity=verbose, ignore_config=ignore_config).print_to_stdout()
 
     if platform.system() == "Windows":
-        assert [m.replace("\\", "/") for m in caplog.messages] == expected
+        assert [m.replace("\\", "/") for m in _logged_lines(caplog)] == expected
     else:
-        assert caplog.messages == expected
+        assert _logged_lines(caplog) == expected
 
 
 def test_skip_private():
@@ -499,6 +595,20 @@ def test_skip_private():
     assert total_results == {"missing_count": 2, "needed_count": 3, "coverage": 33.333333333333336}
 
 
+def test_nested_definitions():
+    """Definitions nested in compound statements (e.g. `if` or `try`) are analyzed as well"""
+    file_path = os.path.join(INDIVIDUAL_SAMPLES_DIR, "nested_definitions.py")
+    file_results, _ = analyze([file_path]).to_legacy()
+    assert file_results[file_path]["missing"] == [
+        "in_else",
+        "in_try",
+        "InTryElse.in_class_for",
+        "in_finally",
+        "outer.in_while",
+    ]
+    assert file_results[file_path]["needed_count"] == 10
+
+
 def test_long_doc():
     """Regression test on issue 79.
 
@@ -531,3 +641,12 @@ def test_skip_decorators(ignore_setter, ignore_deleter, ignore_property, coverag
     )
     result = analyze([os.path.join(INDIVIDUAL_SAMPLES_DIR, "decorators.py")], ignore_config)
     assert result.count_aggregate().coverage() == coverage * 100
+
+
+@pytest.mark.parametrize("printer_cls", [LegacyPrinter, MarkdownPrinter])
+def test_printer_after_pickling(printer_cls):
+    """Identifiers of unpickled results are no longer interned, but must be reported the same"""
+    result = analyze([PARTLY_DOCUMENTED_FILE_PATH], show_progress=False)
+    unpickled_result = pickle.loads(pickle.dumps(result))
+    expected = printer_cls(result, verbosity=4)._generate_string()
+    assert printer_cls(unpickled_result, verbosity=4)._generate_string() == expected
@@ -2,6 +2,7 @@
 little logic. Thus, the tests implemented here are mostly trivial and act primarily as
 smoke- and regression tests."""
 import os
+import pickle
 from typing import Dict
 
 import pytest
@@ -57,6 +58,18 @@ class TestResultCollection:
         assert legacy_results["needed_count"] == 5
         assert legacy_results["coverage"] == 3 / 5 * 100
 
+    def test_to_legacy_after_pickling(self):
+        """Identifiers of an unpickled `ResultCollection` are no longer interned, but must be
+        converted the same"""
+        result_collection = ResultCollection()
+        file = result_collection.get_file(_path("my", "file.py"))
+        file.collect_module_docstring(False)
+        file.collect_docstring("method_x", False)
+        unpickled = pickle.loads(pickle.dumps(result_collection))
+        legacy_file_results, _legacy_results = unpickled.to_legacy()
+        assert legacy_file_results[_path("my", "file.py")]["missing"] == ["method_x"]
+        assert unpickled.to_legacy() == result_collection.to_legacy()
+
 
 class TestFile:
     """Tests the methods in the `File` class"""
@@ -79,6 +92,21 @@ class TestFile:
         assert count.missing == 2
         assert count.needed == 3
 
+    def test_partitioned_nodes(self):
+        """Test that expected docstrings are partitioned by state, and that the cached partition
+        is refreshed once further docstrings are collected"""
+        file = File()
+        file.collect_module_docstring(False)
+        file.collect_docstring("method_one", True, "ignored_nonetheless")
+        file.collect_docstring("method_two", True)
+        assert file.partitioned_nodes == (
+            ["method_two"],
+            ["module docstring"],
+            [("method_one", "ignored_nonetheless")],
+        )
+        file.collect_docstring("method_three", False)
+        assert file.partitioned_nodes[1] == ["module docstring", "method_three"]
+
     def test_set_get_status(self):
         """Default settings and getter / setter of status"""
         file = File()
@@ -149,6 +177,20 @@ class TestAggregateCount:
         )
         assert left + right != other_count
 
+    def test_add_file_count(self):
+        """Verifies that adding a file's count in place is equivalent to the addition operator."""
+        file_count = FileCount()
+        file_count.found_needed_docstr()
+        file_count.missed_needed_docstring()
+        empty_file_count = FileCount()
+        empty_file_count.found_empty_file()
+
+        aggregated = AggregatedCount(num_files=1, num_empty_files=0, needed=2, found=2, missing=0)
+        expected = aggregated + file_count + empty_file_count
+        aggregated._add_file_count(file_count)
+        aggregated._add_file_count(empty_file_count)
+        assert aggregated == expected
+
     @pytest.mark.parametrize(
         ["agg_count", "coverage"],
         [